@@ -2,7 +2,7 @@ import openreview
 from datetime import datetime
 import pytz
 import argparse
-from utils import _get_credentials
+from utils import _get_credentials, _make_bridge_tables
 import os
 import pandas as pd
 from tqdm import tqdm
@@ -189,6 +189,9 @@ def _make_submissions(client, venue_year, save_path):
     except Exception:
         df.to_csv(save_path, escapechar="\\", index=False)
 
+    # ------ keyword/author dimension and bridge tables -----
+    _make_bridge_tables(df, os.path.dirname(save_path))
+
 
 def _make_reviews(client, venue_year):
     """ Create official_reviews.csv """
@@ -2,7 +2,7 @@ import openreview
 from datetime import datetime
 import pytz
 import argparse
-from utils import _get_credentials
+from utils import _get_credentials, _make_bridge_tables
 import os
 import pandas as pd
 
@@ -90,6 +90,9 @@ def _make_submissions(client, venue_id, save_path):
     df["outcome"] = df.apply(func=lambda row: categorize(row["id"]), axis=1)
     df.to_csv(save_path, index=False)
 
+    # ------ keyword/author dimension and bridge tables -----
+    _make_bridge_tables(df, os.path.dirname(save_path))
+
 
 def _make_discussions(client, venue_id, save_dir):
     """ Create official reviews and official comments tables """
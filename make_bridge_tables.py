@@ -0,0 +1,36 @@
+""" Create keyword/author bridge tables from an existing submissions.csv """
+import argparse
+import ast
+import os
+import pandas as pd
+from utils import _make_bridge_tables
+
+
+def _parse_cell(value):
+    """
+    Parse a list cell written by DataFrame.to_csv. Cells that are not a list
+    literal (e.g. 2017 author_emails strings) are returned unchanged.
+    """
+    if isinstance(value, str) and value.startswith("["):
+        return ast.literal_eval(value)
+    return value
+
+
+def _load_submissions(submissions_path):
+    """ Read submissions.csv and parse authors/authorids/keywords cells """
+    df = pd.read_csv(submissions_path)
+    for column in ["authors", "authorids", "keywords"]:
+        df[column] = df[column].apply(_parse_cell)
+    return df
+
+
+if __name__ == "__main__":
+
+    # load arguments
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--save_dir", type=str) # directory containing submissions.csv, e.g. 2017
+    parser.add_argument("--dims_dir", type=str, default=".") # directory containing shared keywords.csv and authors.csv
+    args = parser.parse_args()
+
+    df = _load_submissions(os.path.join(args.save_dir, "submissions.csv"))
+    _make_bridge_tables(df, args.save_dir, args.dims_dir)
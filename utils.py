@@ -1,5 +1,7 @@
 """ utils.py """
 import configparser
+import os
+import pandas as pd
 
 
 def _get_credentials(credentials_path):
@@ -13,3 +15,113 @@ def _get_credentials(credentials_path):
     config = configparser.ConfigParser()
     config.read(credentials_path)
     return config["BASIC"]["USERNAME"], config["BASIC"]["PASSWORD"]
+
+
+def _as_list(value):
+    """
+    Return cell value as a list of strings. authors/authorids/keywords are
+    usually lists, but 2017 v1 rows fall back to author_emails, which can be a
+    single comma separated string.
+    """
+    if isinstance(value, (list, tuple)):
+        return [item for item in value if isinstance(item, str) and item.strip()]
+    if isinstance(value, str):
+        return [item for item in value.split(",") if item.strip()]
+    return []
+
+
+def _normalize(value):
+    """ Lowercase, strip and collapse whitespace """
+    return " ".join(value.split()).lower()
+
+
+def _extend_dictionary(path, id_col, key_col, keys):
+    """
+    Load the shared dimension table at path (if any) and append the keys it
+    does not contain yet, in sorted order, so ids stay stable across venues.
+    Return the extended table and a key -> id mapping.
+    """
+    if os.path.exists(path):
+        dim = pd.read_csv(path, keep_default_na=False)
+    else:
+        dim = pd.DataFrame(columns=[id_col, key_col])
+    known = set(dim[key_col])
+    new_keys = sorted(set(keys) - known)
+    next_id = int(dim[id_col].max()) + 1 if len(dim) else 0
+    new_rows = pd.DataFrame({id_col: range(next_id, next_id + len(new_keys)), key_col: new_keys})
+    dim = pd.concat([dim, new_rows], ignore_index=True) if len(dim) else new_rows
+    dim[id_col] = dim[id_col].astype("int32")
+    return dim, dict(zip(dim[key_col], dim[id_col]))
+
+
+def _make_bridge_tables(df, save_dir, dims_dir="."):
+    """
+    Create dictionary encoded dimension tables and integer bridge tables
+    from the submissions table:
+
+    <dims_dir>/keywords.csv            keyword_id, keyword
+    <save_dir>/submission_keywords.csv submission_id, keyword_id
+    <dims_dir>/authors.csv             author_id, author_key, name
+    <save_dir>/submission_authors.csv  submission_id, author_id, position
+
+    The dimension tables are shared by all venues: existing ids are kept and
+    new keys are appended, so ids can be compared across years.
+    submission_id is the OpenReview id (joins submissions.csv id).
+    """
+    print(f"creating bridge tables in {save_dir} (dimension tables in {dims_dir})")
+
+    # ------ keywords -------
+    keyword_records = []
+    for submission_id, keywords in zip(df["id"], df["keywords"]):
+        # a keyword repeated within one submission is only counted once
+        for keyword in dict.fromkeys(_normalize(item) for item in _as_list(keywords)):
+            keyword_records.append({"submission_id": submission_id, "keyword": keyword})
+    keyword_bridge = pd.DataFrame.from_records(keyword_records, columns=["submission_id", "keyword"])
+    keyword_path = os.path.join(dims_dir, "keywords.csv")
+    keyword_dim, keyword_ids = _extend_dictionary(keyword_path, "keyword_id", "keyword", keyword_bridge["keyword"])
+    keyword_bridge["keyword_id"] = keyword_bridge["keyword"].map(keyword_ids).astype("int32")
+    print(f"found {keyword_bridge['keyword'].nunique()} keywords ({len(keyword_dim)} in shared dictionary)")
+    keyword_dim.to_csv(keyword_path, index=False)
+    keyword_bridge[["submission_id", "keyword_id"]].to_csv(os.path.join(save_dir, "submission_keywords.csv"), index=False)
+
+    # ------ authors -------
+    author_records = []
+    name_fallback_count = 0
+    for submission_id, authors, authorids in zip(df["id"], df["authors"], df["authorids"]):
+        authors = [" ".join(name.split()) for name in _as_list(authors)]
+        authorids = [item.strip() for item in _as_list(authorids)]
+        # key on authorid (profile id or email) when it lines up with authors, else on name
+        if len(authorids) != len(authors):
+            authorids = [""] * len(authors)
+            name_fallback_count += 1
+        seen = set()
+        for position, (name, authorid) in enumerate(zip(authors, authorids)):
+            if authorid.startswith("~"):
+                author_key = authorid
+            elif authorid:
+                author_key = authorid.lower()
+            else:
+                author_key = _normalize(name)
+            if author_key in seen:
+                continue
+            seen.add(author_key)
+            author_records.append({"submission_id": submission_id, "author_key": author_key,
+                                   "name": name, "position": position})
+    author_bridge = pd.DataFrame.from_records(author_records, columns=["submission_id", "author_key", "name", "position"])
+    author_path = os.path.join(dims_dir, "authors.csv")
+    author_dim, author_ids = _extend_dictionary(author_path, "author_id", "author_key", author_bridge["author_key"])
+    author_bridge["author_id"] = author_bridge["author_key"].map(author_ids).astype("int32")
+
+    # display name: most frequent name per author_key, ties broken alphabetically.
+    # authors already in the shared dictionary keep their name
+    names = (author_bridge.groupby(["author_key", "name"]).size().reset_index(name="count")
+             .sort_values(["author_key", "count", "name"], ascending=[True, False, True])
+             .drop_duplicates("author_key").set_index("author_key")["name"])
+    if "name" not in author_dim.columns:
+        author_dim["name"] = ""
+    missing = author_dim["name"].isna() | (author_dim["name"] == "")
+    author_dim.loc[missing, "name"] = author_dim.loc[missing, "author_key"].map(names).fillna("")
+    print(f"found {author_bridge['author_key'].nunique()} authors ({len(author_dim)} in shared dictionary), "
+          f"{name_fallback_count} submissions keyed on author names (authorids did not line up with authors)")
+    author_dim[["author_id", "author_key", "name"]].to_csv(author_path, index=False)
+    author_bridge[["submission_id", "author_id", "position"]].to_csv(os.path.join(save_dir, "submission_authors.csv"), index=False)